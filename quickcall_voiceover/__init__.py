@@ -2,6 +2,13 @@
 
 __version__ = "0.1.0"
 
-from quickcall_voiceover.generator import generate_from_text, generate_voiceover
-
 __all__ = ["generate_voiceover", "generate_from_text", "__version__"]
+
+
+def __getattr__(name: str):
+    # Import the generator lazily so the CLI can start without it
+    if name in ("generate_voiceover", "generate_from_text"):
+        from quickcall_voiceover import generator
+
+        return getattr(generator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
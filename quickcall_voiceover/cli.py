@@ -1,17 +1,28 @@
 """Command-line interface for QuickCall VoiceOver."""
 
+from __future__ import annotations
+
 import argparse
+import contextlib
 import sys
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
+if TYPE_CHECKING:
+    from piper import PiperVoice
+    from rich.console import Console
 
-from quickcall_voiceover.generator import generate_from_text, generate_voiceover
+# Rich and the generator are imported on first use to keep --help and --voices fast
+_console: Console | None = None
 
-console = Console()
+# Voice loaded in the background while interactive mode waits on prompts.
+# _warm_key is the (model_path, device) being loaded, set before the thread starts;
+# _warm_voice holds the voice and the messages printed while loading it.
+_warm_key: tuple[Path, str] | None = None
+_warm_voice: tuple[PiperVoice, str] | None = None
+_warm_ready = threading.Event()
+_warm_lock = threading.Lock()
 
 # Popular voice models with descriptions
 POPULAR_VOICES = {
@@ -29,8 +40,21 @@ POPULAR_VOICES = {
 DEFAULT_VOICE = "en_US-hfc_male-medium"
 
 
+def _get_console() -> Console:
+    """Return the shared Rich console, importing rich on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
 def show_banner() -> None:
     """Display the CLI banner."""
+    from rich.panel import Panel
+
+    console = _get_console()
     console.print()
     console.print(
         Panel(
@@ -43,8 +67,14 @@ def show_banner() -> None:
     console.print()
 
 
-def show_voice_table() -> None:
-    """Display available voices in a table."""
+def show_voice_table(models_dir: Path | None = None) -> None:
+    """Display available voices in a table, marking ones already downloaded."""
+    from rich.table import Table
+
+    from quickcall_voiceover.generator import scan_models
+
+    console = _get_console()
+    downloaded = scan_models(models_dir or Path.cwd() / "models")
     table = Table(title="Popular Voice Models", show_header=True, header_style="bold magenta")
     table.add_column("#", style="dim", width=3)
     table.add_column("Model ID", style="cyan")
@@ -53,7 +83,8 @@ def show_voice_table() -> None:
 
     for i, (model_id, (name, desc)) in enumerate(POPULAR_VOICES.items(), 1):
         default_mark = " [yellow](default)[/yellow]" if model_id == DEFAULT_VOICE else ""
-        table.add_row(str(i), model_id, name + default_mark, desc)
+        cached_mark = " [green]✓ cached[/green]" if f"{model_id}.onnx" in downloaded else ""
+        table.add_row(str(i), model_id, name + default_mark + cached_mark, desc)
 
     console.print(table)
     console.print()
@@ -61,8 +92,83 @@ def show_voice_table() -> None:
     console.print()
 
 
+def _start_preload(voice: str, models_dir: Path, jobs: int | None, device: str, fp32: bool) -> None:
+    """Load an already downloaded voice in the background so generation starts warm."""
+    global _warm_key
+    from quickcall_voiceover.generator import quantized_model, resolve_jobs, scan_models
+
+    model_path = models_dir / f"{voice}.onnx"
+    names = scan_models(models_dir)
+    if model_path.name not in names or f"{model_path.name}.json" not in names:
+        return
+    if not fp32:
+        model_path = quantized_model(model_path)
+
+    # Size the session's threads for the workers a long run will use; the
+    # segment count isn't known until the text has been entered
+    jobs = resolve_jobs(jobs, sys.maxsize, device)
+    _warm_key = (model_path, device)
+    threading.Thread(target=_preload, args=(model_path, jobs, device), daemon=True).start()
+
+
+def _preload(model_path: Path, jobs: int, device: str) -> None:
+    """Background thread body for _start_preload."""
+    global _warm_voice
+    try:
+        from io import StringIO
+
+        from rich.console import Console
+
+        from quickcall_voiceover.generator import load_voice, warm_pcm16_kernel
+
+        warm_pcm16_kernel()
+        # Keep load messages off the prompts; they're shown when the voice is used
+        log = StringIO()
+        voice = load_voice(model_path, jobs, device, Console(file=log))
+        with _warm_lock:
+            # Dropped if the user picked another voice while it was loading
+            if _warm_key is not None:
+                _warm_voice = (voice, log.getvalue())
+    except Exception:
+        pass  # Generation loads the voice itself
+    finally:
+        _warm_ready.set()
+
+
+def _load_warm_voice(
+    model_path: Path, jobs: int = 1, device: str = "cpu", console: Console | None = None
+) -> PiperVoice:
+    """Voice loader that reuses the preloaded voice when it is the one requested.
+
+    The preloaded session keeps the thread count sized for the default number
+    of workers in _start_preload.
+    """
+    global _warm_key, _warm_voice
+    from quickcall_voiceover.generator import load_voice
+
+    with _warm_lock:
+        wanted = _warm_key == (model_path, device)
+        if not wanted:
+            # Free the unused preloaded voice, or keep a pending load from being stored
+            _warm_key = None
+            _warm_voice = None
+
+    if wanted:
+        _warm_ready.wait()
+        with _warm_lock:
+            warm, _warm_voice = _warm_voice, None
+        if warm is not None:
+            voice, log = warm
+            if console and log:
+                console.out(log, end="")
+            return voice
+    return load_voice(model_path, jobs, device, console)
+
+
 def select_voice() -> str:
     """Interactive voice selection."""
+    from rich.prompt import Prompt
+
     show_voice_table()
 
     choice = Prompt.ask(
@@ -85,10 +191,21 @@ def file_text_mode(
     combined_name: str,
     voice: str | None = None,
     config_path: Path | None = None,
+    use_cli: bool = False,
+    jobs: int | None = None,
+    batch_size: int = 1,
+    device: str = "cpu",
+    quantize: bool = False,
+    fp32: bool = False,
 ) -> int:
     """Generate voice-over from a text file, optionally with voice config from JSON."""
     import json
 
+    from rich.panel import Panel
+
+    from quickcall_voiceover.generator import generate_from_text, load_config
+
+    console = _get_console()
     show_banner()
 
     if not text_file.exists():
@@ -109,7 +226,7 @@ def file_text_mode(
             console.print(f"[red]Error: Config file not found: {config_path}[/red]")
             return 1
         try:
-            config = json.loads(config_path.read_text())
+            config = load_config(config_path)
             voice_settings = config.get("voice", {})
         except json.JSONDecodeError as e:
             console.print(f"[red]Error parsing config file: {e}[/red]")
@@ -146,6 +263,12 @@ def file_text_mode(
         noise_scale=voice_settings.get("noise_scale"),
         noise_w=voice_settings.get("noise_w"),
         sentence_silence=voice_settings.get("sentence_silence"),
+        use_cli=use_cli,
+        jobs=jobs,
+        batch_size=batch_size,
+        device=device,
+        quantize=quantize,
+        fp32=fp32,
     )
 
     if success:
@@ -161,10 +284,27 @@ def file_text_mode(
     return 0 if success else 1
 
 
-def interactive_text_mode() -> int:
+def interactive_text_mode(
+    use_cli: bool = False,
+    jobs: int | None = None,
+    batch_size: int = 1,
+    device: str = "cpu",
+    quantize: bool = False,
+    fp32: bool = False,
+) -> int:
     """Interactive text-based voice-over generation."""
+    from rich.panel import Panel
+    from rich.prompt import Confirm, Prompt
+
+    from quickcall_voiceover.generator import generate_from_text
+
+    console = _get_console()
     show_banner()
 
+    # Most runs keep the default voice, so load it while the user answers the prompts
+    if not use_cli:
+        _start_preload(DEFAULT_VOICE, Path.cwd() / "models", jobs, device, fp32)
+
     console.print(
         Panel(
             "[bold]Text Mode[/bold]\n\n"
@@ -192,14 +332,26 @@ def interactive_text_mode() -> int:
     console.print("\n[bold]Enter your text[/bold] (one segment per line, empty line to finish):\n")
 
     lines = []
-    while True:
+    if sys.stdin.isatty():
         try:
-            line = input()
+            import readline  # noqa: F401 - line editing and history for input()
+        except ImportError:
+            pass
+
+        while True:
+            try:
+                line = input()
+                if not line:
+                    break
+                lines.append(line)
+            except EOFError:
+                break
+    else:
+        # Piped or pasted input: read it all at once, then stop at the first empty line
+        for line in sys.stdin.read().splitlines():
             if not line:
                 break
             lines.append(line)
-        except EOFError:
-            break
 
     if not lines:
         console.print("[red]No text provided. Exiting.[/red]")
@@ -207,14 +359,28 @@ def interactive_text_mode() -> int:
 
     console.print(f"\n[green]✓[/green] Got {len(lines)} segments\n")
 
-    # Generate
-    with console.status("[bold green]Generating voice-over..."):
+    # Generate. The spinner only helps on a terminal with one segment at a time;
+    # otherwise the per-segment lines already show progress.
+    if console.is_terminal and jobs == 1:
+        progress = console.status("[bold green]Generating voice-over...")
+    else:
+        console.print("[bold green]Generating voice-over...[/bold green]")
+        progress = contextlib.nullcontext()
+
+    with progress:
         success = generate_from_text(
             lines=lines,
             voice=voice,
             output_dir=output_dir,
             combine=combine,
             console=console,
+            use_cli=use_cli,
+            jobs=jobs,
+            batch_size=batch_size,
+            device=device,
+            quantize=quantize,
+            fp32=fp32,
+            voice_loader=_load_warm_voice,
         )
 
     if success:
@@ -232,6 +398,11 @@ def interactive_text_mode() -> int:
 
 def config_mode(args: argparse.Namespace) -> int:
     """Config file based generation."""
+    from rich.panel import Panel
+
+    from quickcall_voiceover.generator import generate_voiceover
+
+    console = _get_console()
     show_banner()
 
     console.print(
@@ -257,6 +428,12 @@ def config_mode(args: argparse.Namespace) -> int:
         combine=args.combine,
         combined_filename=args.combined_name,
         console=console,
+        use_cli=args.piper_cli,
+        jobs=args.jobs,
+        batch_size=args.batch_size,
+        device=args.device,
+        quantize=args.quantize,
+        fp32=args.fp32,
     )
 
     if success:
@@ -342,20 +519,73 @@ Examples:
         action="store_true",
         help="Show available voice models and exit",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of segments to synthesize in parallel (default: CPU count)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help=(
+            "Segments to synthesize per model run; needs a voice patched with an "
+            "alignment output (default: 1, no batching)"
+        ),
+    )
+    parser.add_argument(
+        "--device",
+        choices=["cpu", "cuda", "coreml"],
+        default="cpu",
+        help="ONNX Runtime device for synthesis (default: cpu)",
+    )
+    parser.add_argument(
+        "--quantize",
+        action="store_true",
+        help="Create and use an int8-quantized copy of the voice model (faster on CPU)",
+    )
+    parser.add_argument(
+        "--fp32",
+        action="store_true",
+        help="Always use the original fp32 voice model, even if an int8 copy exists",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Suppress progress output; the exit code reports success",
+    )
+    parser.add_argument(
+        "--piper-cli",
+        action="store_true",
+        help="Run the piper CLI once per segment instead of in-process (slower, for debugging)",
+    )
 
     args = parser.parse_args()
 
+    if args.quiet:
+        _get_console().quiet = True
+
     # Show voices and exit
     if args.voices:
         show_banner()
-        show_voice_table()
+        show_voice_table(args.models)
         return 0
 
     # Text mode - file or interactive
     if args.text is not None:
         if args.text is True:
             # Interactive mode (no file provided)
-            return interactive_text_mode()
+            return interactive_text_mode(
+                use_cli=args.piper_cli,
+                jobs=args.jobs,
+                batch_size=args.batch_size,
+                device=args.device,
+                quantize=args.quantize,
+                fp32=args.fp32,
+            )
         else:
             # File mode
             return file_text_mode(
@@ -365,12 +595,18 @@ Examples:
                 combined_name=args.combined_name,
                 voice=args.voice,
                 config_path=args.config,
+                use_cli=args.piper_cli,
+                jobs=args.jobs,
+                batch_size=args.batch_size,
+                device=args.device,
+                quantize=args.quantize,
+                fp32=args.fp32,
             )
 
     # Config mode requires a config file
     if not args.config:
         parser.print_help()
-        console.print("\n[yellow]Tip: Use --text for interactive text mode[/yellow]")
+        _get_console().print("\n[yellow]Tip: Use --text for interactive text mode[/yellow]")
         return 1
 
     return config_mode(args)
@@ -3,67 +3,617 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
+import queue
+import shutil
+import struct
 import subprocess
 import sys
+import threading
 import wave
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterable
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
 if TYPE_CHECKING:
+    import numpy as np
+    from piper import PiperVoice
     from rich.console import Console
 
+# os.sendfile only accepts regular-file destinations on Linux
+USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+# ONNX Runtime execution providers for each --device choice
+DEVICE_PROVIDERS: dict[str, list] = {
+    "cpu": ["CPUExecutionProvider"],
+    "cuda": [
+        ("CUDAExecutionProvider", {"cudnn_conv_algo_search": "HEURISTIC"}),
+        "CPUExecutionProvider",
+    ],
+    "coreml": ["CoreMLExecutionProvider", "CPUExecutionProvider"],
+}
+
+# Largest relative RMS change accepted from an int8-quantized model
+QUANTIZE_RMS_TOLERANCE = 0.25
+QUANTIZE_CHECK_TEXT = "The quick brown fox jumps over the lazy dog."
+
+MANIFEST_NAME = ".manifest.json"
+
+# piper.download_voices pulls in heavy imports, so it is loaded on first use
+_download_voice = None
+# Parsed models_dir manifests, keyed by directory
+_manifests: dict[Path, dict] = {}
+
+# numba float32 -> int16 kernel, compiled on first use when numba is installed
+_pcm16_kernel: Callable | None = None
+_pcm16_loaded = False
+_pcm16_lock = threading.Lock()
+
 
 def load_config(config_path: Path) -> dict:
-    """Load configuration from JSON file."""
-    with open(config_path, "r") as f:
-        return json.load(f)
+    """Load configuration from JSON file (decoded with orjson when installed)."""
+    return _loads(Path(config_path).read_bytes())
+
+
+def _load_manifest(models_dir: Path) -> dict:
+    """Return the cached manifest of downloaded voices for models_dir."""
+    if models_dir not in _manifests:
+        try:
+            manifest = json.loads((models_dir / MANIFEST_NAME).read_text())
+        except (OSError, ValueError):
+            manifest = {}
+        _manifests[models_dir] = manifest
+    return _manifests[models_dir]
+
+
+def _save_manifest(models_dir: Path, manifest: dict) -> None:
+    """Atomically write the manifest of downloaded voices."""
+    tmp_path = models_dir / f"{MANIFEST_NAME}.tmp"
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp_path, models_dir / MANIFEST_NAME)
+
+
+@lru_cache(maxsize=4)
+def _scan_models(models_dir: str, mtime_ns: int) -> frozenset[str]:
+    """List voice model files in models_dir; mtime_ns invalidates the cache on changes."""
+    with os.scandir(models_dir) as entries:
+        return frozenset(e.name for e in entries if e.name.endswith((".onnx", ".onnx.json")))
+
+
+def scan_models(models_dir: Path) -> frozenset[str]:
+    """Return the .onnx and .onnx.json file names present in models_dir."""
+    try:
+        mtime_ns = os.stat(models_dir).st_mtime_ns
+    except OSError:
+        return frozenset()
+    return _scan_models(str(models_dir), mtime_ns)
+
+
+def _file_stamp(path: Path) -> dict | None:
+    """Return the size recorded for path in the manifest, or None if it is missing."""
+    try:
+        return {"size": path.stat().st_size}
+    except OSError:
+        return None
 
 
 def ensure_voice_downloaded(model: str, models_dir: Path, console: Console | None = None) -> Path:
-    """Download voice model if not present, return path to onnx file."""
-    from piper.download_voices import download_voice
+    """Download voice model and config if not present, return path to onnx file.
+
+    The manifest marks a download as pending until it completes, then records
+    the size of each file. A voice whose download was interrupted or whose
+    files changed size is fetched again; files the manifest doesn't know
+    about (e.g. copied in by hand) are used as they are.
+    """
+    global _download_voice
 
     model_file = models_dir / f"{model}.onnx"
-    if model_file.exists():
+    config_file = models_dir / f"{model}.onnx.json"
+    files = (model_file, config_file)
+    manifest = _load_manifest(models_dir)
+    recorded = manifest.get(model)
+    stamps = {path.name: _file_stamp(path) for path in files}
+    present = None not in stamps.values()
+    verified = recorded is not None and all(
+        stamp is not None and recorded.get(name, {}).get("size") == stamp["size"]
+        for name, stamp in stamps.items()
+    )
+
+    if present and (recorded is None or verified):
         if console:
             console.print(f"[green]✓[/green] Voice model cached: [cyan]{model}[/cyan]")
         else:
             print(f"Voice model already downloaded: {model}")
         return model_file
 
-    if console:
-        console.print(f"[yellow]↓[/yellow] Downloading voice model: [cyan]{model}[/cyan]...")
+    if recorded is not None:
+        if console:
+            console.print(
+                f"[yellow]↓[/yellow] Voice model incomplete or changed, re-downloading: "
+                f"[cyan]{model}[/cyan]..."
+            )
+        else:
+            print(f"Voice model incomplete or changed, re-downloading: {model}...")
     else:
-        print(f"Downloading voice model: {model}...")
+        if console:
+            console.print(f"[yellow]↓[/yellow] Downloading voice model: [cyan]{model}[/cyan]...")
+        else:
+            print(f"Downloading voice model: {model}...")
+        # An empty entry marks the download as pending, so an interrupted one is retried
+        manifest[model] = {}
+        _save_manifest(models_dir, manifest)
 
-    download_voice(model, models_dir)
+    if _download_voice is None:
+        from piper.download_voices import download_voice as _download_voice
+
+    try:
+        # Skips files that are already present unless the manifest check failed
+        _download_voice(model, models_dir, force_redownload=recorded is not None)
+    except Exception as e:
+        # Keep using the existing files if the failed re-download left them untouched
+        if not present or {path.name: _file_stamp(path) for path in files} != stamps:
+            raise
+        msg = f"Could not re-download {model} ({e}), using the existing files"
+        if console:
+            console.print(f"[yellow]{msg}[/yellow]")
+        else:
+            print(msg)
+        return model_file
 
     if console:
         console.print(f"[green]✓[/green] Downloaded to: [dim]{models_dir}[/dim]")
     else:
         print(f"Downloaded to: {models_dir}")
 
+    manifest[model] = {path.name: _file_stamp(path) for path in files}
+    _save_manifest(models_dir, manifest)
+
     return model_file
 
 
+def _reference_rms(model_path: Path) -> float:
+    """RMS of a fixed phrase synthesized without noise, for comparing model variants."""
+    import numpy as np
+    from piper import SynthesisConfig
+
+    voice = load_voice(model_path)
+    syn_config = SynthesisConfig(noise_scale=0.0, noise_w_scale=0.0)
+    audio = np.concatenate(
+        [
+            voice.phoneme_ids_to_audio(voice.phonemes_to_ids(phonemes), syn_config).ravel()
+            for phonemes in voice.phonemize(QUANTIZE_CHECK_TEXT)
+        ]
+    )
+    return float(np.sqrt(np.mean(np.square(audio, dtype=np.float64))))
+
+
+def quantized_model(model_path: Path, create: bool = False, console: Console | None = None) -> Path:
+    """Return the int8 variant of model_path if present, creating it first when asked.
+
+    A new int8 model is kept only if its output level on a reference phrase
+    stays within QUANTIZE_RMS_TOLERANCE of the fp32 model; otherwise the
+    fp32 path is returned. Either outcome is recorded in a sidecar with the
+    fp32 model's stamp, so an int8 copy is only used, and a rejection only
+    remembered, while the fp32 model is unchanged.
+    """
+    int8_path = model_path.with_suffix(".int8.onnx")
+    int8_config = Path(f"{int8_path}.json")
+    check_path = Path(f"{int8_path}.check")
+
+    def report(msg: str, style: str) -> None:
+        if console:
+            console.print(f"[{style}]{msg}[/{style}]")
+        else:
+            print(msg)
+
+    # {"source": fp32 stamp, "accepted": bool} from the last quantization of this model
+    fp32_stamp = _file_stamp(model_path)
+    try:
+        check = _loads(check_path.read_bytes())
+    except (OSError, ValueError):
+        check = {}
+    current = fp32_stamp is not None and check.get("source") == fp32_stamp
+
+    if current and check.get("accepted") and int8_path.exists() and int8_config.exists():
+        if console:
+            console.print(f"[green]✓[/green] Using int8 model: [cyan]{int8_path.name}[/cyan]")
+        return int8_path
+    if not create:
+        if console and int8_path.exists():
+            console.print(
+                f"[yellow]int8 model {int8_path.name} is out of date, using fp32 "
+                f"(rerun with --quantize to rebuild it)[/yellow]"
+            )
+        return model_path
+    if current and check.get("accepted") is False:
+        report(f"int8 model was rejected for {model_path.name} before, using fp32", "yellow")
+        return model_path
+
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        report("Quantization needs the onnx package (pip install onnx), using fp32", "yellow")
+        return model_path
+
+    report(f"Quantizing {model_path.name} to int8...", "yellow")
+    tmp_path = int8_path.with_name(f"{int8_path.name}.tmp")
+    try:
+        quantize_dynamic(
+            model_path,
+            tmp_path,
+            weight_type=QuantType.QInt8,
+            op_types_to_quantize=["Conv", "MatMul", "Gemm"],
+        )
+        shutil.copyfile(f"{model_path}.json", f"{tmp_path}.json")
+
+        fp32_rms = _reference_rms(model_path)
+        int8_rms = _reference_rms(tmp_path)
+        delta = abs(int8_rms - fp32_rms) / max(fp32_rms, 1e-8)
+        if not delta <= QUANTIZE_RMS_TOLERANCE:
+            report(f"int8 model rejected (output level changed {delta:.0%}), using fp32", "red")
+            check_path.write_text(json.dumps({"source": fp32_stamp, "accepted": False}))
+            # Any older int8 copy was built from a previous fp32 model
+            int8_path.unlink(missing_ok=True)
+            int8_config.unlink(missing_ok=True)
+            return model_path
+
+        os.replace(tmp_path, int8_path)
+        os.replace(f"{tmp_path}.json", int8_config)
+        check_path.write_text(json.dumps({"source": fp32_stamp, "accepted": True}))
+    except Exception as e:
+        report(f"Quantization failed ({e}), using fp32", "red")
+        return model_path
+    finally:
+        tmp_path.unlink(missing_ok=True)
+        Path(f"{tmp_path}.json").unlink(missing_ok=True)
+
+    report(f"✓ Saved int8 model: {int8_path.name}", "green")
+    return int8_path
+
+
+def load_voice(
+    model_path: Path, jobs: int = 1, device: str = "cpu", console: Console | None = None
+) -> PiperVoice:
+    """Load a Piper voice model once so it can be reused for every segment."""
+    import onnxruntime
+    from piper import PiperConfig, PiperVoice
+
+    with open(f"{model_path}.json", "r", encoding="utf-8") as f:
+        config = PiperConfig.from_dict(json.load(f))
+
+    sess_options = onnxruntime.SessionOptions()
+    sess_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    sess_options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+    # Input lengths change with every sentence, so memory-pattern planning never pays off
+    sess_options.enable_mem_pattern = False
+    # Split the cores between segments running in parallel instead of oversubscribing them
+    sess_options.intra_op_num_threads = max(1, (os.cpu_count() or 1) // max(1, jobs))
+    sess_options.inter_op_num_threads = 1
+
+    providers = DEVICE_PROVIDERS[device]
+    fallback = None
+    requested = providers[0] if isinstance(providers[0], str) else providers[0][0]
+    if requested not in onnxruntime.get_available_providers():
+        fallback = f"{requested} is not available, running on CPU"
+        providers = DEVICE_PROVIDERS["cpu"]
+
+    try:
+        session = onnxruntime.InferenceSession(
+            str(model_path), sess_options=sess_options, providers=providers
+        )
+    except Exception as e:
+        if providers is DEVICE_PROVIDERS["cpu"]:
+            raise
+        fallback = f"Could not use {device} ({e}), falling back to CPU"
+        session = onnxruntime.InferenceSession(
+            str(model_path), sess_options=sess_options, providers=DEVICE_PROVIDERS["cpu"]
+        )
+
+    if fallback:
+        if console:
+            console.print(f"[yellow]{fallback}[/yellow]")
+        else:
+            print(fallback)
+    voice = PiperVoice(session=session, config=config)
+
+    # One tiny inference up front so the first real segment doesn't absorb the warm-up
+    voice.phoneme_ids_to_audio(voice.phonemes_to_ids([]))
+    return voice
+
+
+def resolve_jobs(jobs: int | None, num_segments: int, device: str = "cpu") -> int:
+    """Return the number of parallel synthesis workers to use."""
+    if jobs is None:
+        # A single stream keeps a GPU busy; CPUs scale with one worker per core
+        jobs = (os.cpu_count() or 1) if device == "cpu" else 1
+    return max(1, min(jobs, num_segments))
+
+
+def _get_pcm16_kernel() -> Callable | None:
+    """Return the numba clip/scale/cast kernel, or None if numba is not installed."""
+    global _pcm16_kernel, _pcm16_loaded
+
+    with _pcm16_lock:
+        if not _pcm16_loaded:
+            _pcm16_loaded = True
+            try:
+                import numba
+                import numpy as np
+            except ImportError:
+                return None
+
+            scale = np.float32(32767.0)
+            low = np.float32(-32768.0)
+
+            @numba.njit(cache=True, fastmath=True, nogil=True)
+            def f32_to_pcm16(audio, out):
+                # float32 arithmetic, matching the NumPy fallback sample for sample
+                for i in range(audio.shape[0]):
+                    v = audio[i] * scale
+                    if v > scale:
+                        v = scale
+                    elif v < low:
+                        v = low
+                    out[i] = np.int16(v)
+
+            _pcm16_kernel = f32_to_pcm16
+    return _pcm16_kernel
+
+
+def warm_pcm16_kernel() -> None:
+    """Compile the numba kernel on a background thread so segments don't wait for it."""
+    import numpy as np
+
+    def warm() -> None:
+        kernel = _get_pcm16_kernel()
+        if kernel is not None:
+            kernel(np.zeros(1, dtype=np.float32), np.zeros(1, dtype="<i2"))
+
+    threading.Thread(target=warm, daemon=True).start()
+
+
+def _sentences_to_pcm(
+    sentences: Iterable[np.ndarray], sample_rate: int, sentence_silence: float
+) -> np.ndarray:
+    """Join float sentence audio into one int16 PCM buffer, with silence between sentences."""
+    import numpy as np
+
+    sentences = list(sentences)
+    gap = int(sample_rate * sentence_silence)
+    total = sum(len(audio) for audio in sentences) + gap * max(0, len(sentences) - 1)
+
+    kernel = _get_pcm16_kernel()
+    pcm = np.zeros(total, dtype="<i2")
+    pos = 0
+    for i, audio in enumerate(sentences):
+        if i > 0:
+            pos += gap
+        out = pcm[pos : pos + len(audio)]
+        if kernel is not None:
+            # Fused clip, scale and cast, written straight into the output buffer
+            kernel(audio, out)
+        else:
+            out[:] = np.clip(audio * 32767.0, -32768.0, 32767.0)
+        pos += len(audio)
+    return pcm
+
+
+def _write_wav_fast(output_path: str, pcm: np.ndarray, sample_rate: int) -> None:
+    """Write 16-bit mono PCM as a canonical 44-byte-header WAV file."""
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + pcm.nbytes,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        1,  # mono
+        sample_rate,
+        sample_rate * 2,
+        2,
+        16,
+        b"data",
+        pcm.nbytes,
+    )
+    with open(output_path, "wb") as f:
+        f.write(header)
+        pcm.tofile(f)
+
+
+class WavWriter:
+    """Background thread that writes finished PCM to disk while synthesis continues."""
+
+    def __init__(self, maxsize: int = 2):
+        self.failed: set[str] = set()
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, output_path: str, pcm: np.ndarray, sample_rate: int) -> None:
+        """Queue a WAV file for writing, blocking if the writer is behind."""
+        self._queue.put((output_path, pcm, sample_rate))
+
+    def close(self) -> None:
+        """Flush all queued files and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            output_path, pcm, sample_rate = item
+            try:
+                _write_wav_fast(output_path, pcm, sample_rate)
+            except Exception as e:
+                print(f"Error writing audio: {e}")
+                self.failed.add(output_path)
+
+
+def _save_pcm(
+    output_path: str, pcm: np.ndarray, sample_rate: int, writer: WavWriter | None
+) -> None:
+    """Write PCM now, or hand it to the background writer if there is one."""
+    if writer is None:
+        _write_wav_fast(output_path, pcm, sample_rate)
+    else:
+        writer.write(output_path, pcm, sample_rate)
+
+
 def generate_segment(
     text: str,
-    output_path: Path,
-    model_path: Path,
+    output_path: str,
+    voice: PiperVoice,
+    length_scale: float = 1.0,
+    noise_scale: float = 0.667,
+    noise_w: float = 0.8,
+    sentence_silence: float = 0.5,
+    writer: WavWriter | None = None,
+) -> bool:
+    """Generate a single audio segment using a preloaded Piper voice."""
+    from piper import SynthesisConfig
+
+    syn_config = SynthesisConfig(
+        length_scale=length_scale,
+        noise_scale=noise_scale,
+        noise_w_scale=noise_w,
+    )
+
+    try:
+        sample_rate = voice.config.sample_rate
+        chunks = voice.synthesize(text, syn_config)
+        pcm = _sentences_to_pcm(
+            (chunk.audio_float_array for chunk in chunks), sample_rate, sentence_silence
+        )
+        _save_pcm(output_path, pcm, sample_rate, writer)
+        return True
+    except Exception as e:
+        print(f"Error generating audio: {e}")
+        return False
+
+
+def has_alignment_output(voice: PiperVoice) -> bool:
+    """Return True if the voice model reports frames per phoneme id as a second output."""
+    return len(voice.session.get_outputs()) > 1
+
+
+def synthesize_batch(
+    texts: list[str],
+    out_paths: list[str],
+    voice: PiperVoice,
+    length_scale: float = 1.0,
+    noise_scale: float = 0.667,
+    noise_w: float = 0.8,
+    sentence_silence: float = 0.5,
+    writer: WavWriter | None = None,
+) -> list[bool]:
+    """Generate several segments with a single padded ONNX run over all their sentences.
+
+    Each row's audio length comes from the frames per phoneme id reported by
+    voices patched with an alignment output. Voices without one, or a failed
+    batched run, fall back to per-segment synthesis.
+    """
+    import numpy as np
+    from piper.const import PAD
+
+    params = {
+        "length_scale": length_scale,
+        "noise_scale": noise_scale,
+        "noise_w": noise_w,
+        "sentence_silence": sentence_silence,
+    }
+
+    if not has_alignment_output(voice):
+        return [
+            generate_segment(t, p, voice, **params, writer=writer) for t, p in zip(texts, out_paths)
+        ]
+
+    try:
+        # (segment index, phoneme ids) for every sentence of every text
+        sentences: list[tuple[int, list[int]]] = []
+        for n, text in enumerate(texts):
+            for phonemes in voice.phonemize(text):
+                sentences.append((n, voice.phonemes_to_ids(phonemes)))
+
+        input_lengths = np.array([len(ids) for _, ids in sentences], dtype=np.int64)
+        pad_id = voice.config.phoneme_id_map[PAD][0]
+        input_ids = np.full((len(sentences), input_lengths.max()), pad_id, dtype=np.int64)
+        for row, (_, ids) in enumerate(sentences):
+            input_ids[row, : len(ids)] = ids
+
+        args = {
+            "input": input_ids,
+            "input_lengths": input_lengths,
+            "scales": np.array([noise_scale, length_scale, noise_w], dtype=np.float32),
+        }
+        if voice.config.num_speakers > 1:
+            args["sid"] = np.full(len(sentences), voice.config.default_speaker_id, dtype=np.int64)
+
+        outputs = voice.session.run(None, args)
+        audio = outputs[0].reshape(len(sentences), -1)
+        durations = outputs[1].reshape(len(sentences), -1)
+    except Exception as e:
+        print(f"Batched synthesis failed, generating segments one by one: {e}")
+        return [
+            generate_segment(t, p, voice, **params, writer=writer) for t, p in zip(texts, out_paths)
+        ]
+
+    per_segment: list[list[np.ndarray]] = [[] for _ in texts]
+    for row, (n, _) in enumerate(sentences):
+        frames = durations[row, : input_lengths[row]].sum()
+        length = min(int(frames * voice.config.hop_length), audio.shape[1])
+        samples = audio[row, :length]
+
+        # Same post-processing as PiperVoice.synthesize
+        max_val = np.max(np.abs(samples)) if length else 0.0
+        if max_val < 1e-8:
+            samples = np.zeros_like(samples)
+        else:
+            samples = samples / max_val
+        per_segment[n].append(np.clip(samples, -1.0, 1.0).astype(np.float32))
+
+    sample_rate = voice.config.sample_rate
+    results = []
+    for output_path, segment_audio in zip(out_paths, per_segment):
+        try:
+            pcm = _sentences_to_pcm(segment_audio, sample_rate, sentence_silence)
+            _save_pcm(output_path, pcm, sample_rate, writer)
+            results.append(True)
+        except Exception as e:
+            print(f"Error generating audio: {e}")
+            results.append(False)
+    return results
+
+
+def generate_segment_cli(
+    text: str,
+    output_path: str,
+    model_path: str,
     length_scale: float = 1.0,
     noise_scale: float = 0.667,
     noise_w: float = 0.8,
     sentence_silence: float = 0.5,
 ) -> bool:
-    """Generate a single audio segment using piper CLI."""
+    """Generate a single audio segment using piper CLI (slower, for debugging)."""
     cmd = [
         sys.executable,
         "-m",
         "piper",
         "--model",
-        str(model_path),
+        model_path,
         "--output_file",
-        str(output_path),
+        output_path,
         "--length_scale",
         str(length_scale),
         "--noise_scale",
@@ -74,38 +624,218 @@ def generate_segment(
         str(sentence_silence),
     ]
 
+    # Keep only the tail of piper's stderr for error reporting
+    stderr_tail: deque[str] = deque(maxlen=64)
+
     try:
-        subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            input=text,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
-            capture_output=True,
-            check=True,
         )
+    except OSError as e:
+        print(f"Error generating audio: {e}")
+        return False
+
+    drain = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+    drain.start()
+    try:
+        proc.stdin.write(text)
+        proc.stdin.close()
+    except BrokenPipeError:
+        pass
+    proc.wait()
+    drain.join()
+
+    if proc.returncode != 0:
+        print(f"Error generating audio: {''.join(stderr_tail)}")
+        return False
+    return True
+
+
+def _make_synth(
+    model_path: Path,
+    jobs: int,
+    use_cli: bool,
+    batch_size: int,
+    writer: WavWriter | None,
+    device: str = "cpu",
+    console: Console | None = None,
+    voice_loader: Callable[..., PiperVoice] = load_voice,
+) -> Callable[..., list[bool]]:
+    """Return a callable generating a group of texts into their output paths."""
+    if use_cli:
+        segment = partial(generate_segment_cli, model_path=str(model_path))
+    else:
+        warm_pcm16_kernel()
+        voice = voice_loader(model_path, jobs, device, console)
+        if batch_size > 1 and has_alignment_output(voice):
+            return partial(synthesize_batch, voice=voice, writer=writer)
+        if batch_size > 1:
+            msg = (
+                "Voice model has no alignment output, synthesizing segments one by one "
+                "(add one with python -m piper.patch_voice_with_alignment to batch)"
+            )
+            if console:
+                console.print(f"[yellow]{msg}[/yellow]")
+            else:
+                print(msg)
+        segment = partial(generate_segment, voice=voice, writer=writer)
+
+    def synth(texts: list[str], out_paths: list[str], **params) -> list[bool]:
+        return [segment(text, path, **params) for text, path in zip(texts, out_paths)]
+
+    return synth
+
+
+def _synth(
+    tasks: list[tuple[int, str, str]], synth: Callable[..., list[bool]], params: dict
+) -> list[tuple[int, str, bool]]:
+    """Thread pool worker: generate a group of segments and report their indices."""
+    ready = []
+    failed = []
+    for i, text, path in tasks:
+        # Break hardlinks left by an earlier run's reused segments before overwriting
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error preparing output file: {e}")
+            failed.append((i, path, False))
+            continue
+        ready.append((i, text, path))
+
+    if not ready:
+        return failed
+    indices = [i for i, _, _ in ready]
+    texts = [text for _, text, _ in ready]
+    paths = [path for _, _, path in ready]
+    return list(zip(indices, paths, synth(texts, paths, **params))) + failed
+
+
+def _batched(tasks: list, batch_size: int) -> list[list]:
+    """Split tasks into consecutive groups of at most batch_size."""
+    batch_size = max(1, batch_size)
+    return [tasks[k : k + batch_size] for k in range(0, len(tasks), batch_size)]
+
+
+def _dedupe(
+    tasks: list[tuple[int, str, str]],
+) -> tuple[list[tuple[int, str, str]], list[tuple[int, int, str]]]:
+    """Split tasks into first occurrences of each text and repeats of an earlier one.
+
+    All segments of a run share the same voice settings, so the text alone
+    identifies the audio. Repeats are returned as (index, source index, path).
+    """
+    seen: dict[str, int] = {}
+    unique = []
+    repeats = []
+    for i, text, output_file in tasks:
+        if text in seen:
+            repeats.append((i, seen[text], output_file))
+        else:
+            seen[text] = i
+            unique.append((i, text, output_file))
+    return unique, repeats
+
+
+def _link_or_copy(source: str, target: str) -> bool:
+    """Hardlink target to source, copying on filesystems without hardlinks."""
+    if source == target:
+        return True
+    try:
+        try:
+            os.unlink(target)
+        except FileNotFoundError:
+            pass
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error generating audio: {e.stderr}")
+    except OSError as e:
+        print(f"Error reusing audio: {e}")
         return False
 
 
+def _find_data_chunk(f: BinaryIO) -> tuple[int, int]:
+    """Return (offset, size) of the PCM payload in a RIFF/WAVE file."""
+    f.seek(0)
+    riff, _, wave_id = struct.unpack("<4sI4s", f.read(12))
+    if riff != b"RIFF" or wave_id != b"WAVE":
+        raise ValueError("not a RIFF/WAVE file")
+
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            raise ValueError("no data chunk found")
+        chunk_id, chunk_size = struct.unpack("<4sI", header)
+        if chunk_id == b"data":
+            return f.tell(), chunk_size
+        # Chunks are word aligned
+        f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+
+def _copy_range(src: BinaryIO, dst: BinaryIO, offset: int, length: int) -> None:
+    """Append ``length`` bytes of src starting at ``offset`` to dst without buffering them."""
+    if length == 0:
+        return
+
+    if USE_SENDFILE:
+        # In-kernel copy; dst must not hold unflushed writes
+        dst.flush()
+        while length > 0:
+            sent = os.sendfile(dst.fileno(), src.fileno(), offset, length)
+            if sent == 0:
+                raise ValueError("unexpected end of WAV data")
+            offset += sent
+            length -= sent
+        return
+
+    with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if offset + length > len(mm):
+            raise ValueError("unexpected end of WAV data")
+        with memoryview(mm) as view, view[offset : offset + length] as data:
+            dst.write(data)
+
+
 def combine_wav_files(
-    wav_files: list[Path], output_path: Path, console: Console | None = None
+    wav_files: list[str | Path], output_path: Path, console: Console | None = None
 ) -> bool:
-    """Combine multiple WAV files into a single file."""
+    """Combine multiple WAV files into a single file.
+
+    PCM payloads are copied into the output with os.sendfile (or mmap where
+    unavailable) and the RIFF/data sizes are patched once at the end, so no
+    segment is decoded in memory.
+    """
     if not wav_files:
         return False
 
     try:
-        # Read first file to get parameters
+        # Write an empty header using the first file's parameters
         with wave.open(str(wav_files[0]), "rb") as first:
             params = first.getparams()
-
-        # Combine all files
         with wave.open(str(output_path), "wb") as output:
-            output.setparams(params)
+            output.setparams(params._replace(nframes=0))
+
+        with open(output_path, "r+b") as dst:
+            data_offset, _ = _find_data_chunk(dst)
+            dst.seek(0, os.SEEK_END)
+
             for wav_file in wav_files:
-                with wave.open(str(wav_file), "rb") as w:
-                    output.writeframes(w.readframes(w.getnframes()))
+                with open(wav_file, "rb") as src:
+                    offset, size = _find_data_chunk(src)
+                    _copy_range(src, dst, offset, size)
+
+            # Re-sync with the OS file position, which sendfile advanced directly
+            total_data = dst.seek(0, os.SEEK_END) - data_offset
+            dst.seek(4)
+            dst.write(struct.pack("<I", data_offset - 8 + total_data))
+            dst.seek(data_offset - 4)
+            dst.write(struct.pack("<I", total_data))
 
         return True
     except Exception as e:
@@ -129,6 +859,13 @@ def generate_from_text(
     noise_scale: float | None = None,
     noise_w: float | None = None,
     sentence_silence: float | None = None,
+    use_cli: bool = False,
+    jobs: int | None = None,
+    batch_size: int = 1,
+    device: str = "cpu",
+    quantize: bool = False,
+    fp32: bool = False,
+    voice_loader: Callable[..., PiperVoice] | None = None,
 ) -> bool:
     """
     Generate voice-over audio from a list of text lines.
@@ -145,6 +882,13 @@ def generate_from_text(
         noise_scale: Voice variation, default 0.667
         noise_w: Phoneme width noise, default 0.8
         sentence_silence: Silence between sentences in seconds, default 0.5
+        use_cli: If True, run the piper CLI per segment instead of in-process
+        jobs: Number of segments to synthesize in parallel (default: CPU count)
+        batch_size: Segments to synthesize per ONNX run (default: 1, no batching)
+        device: ONNX Runtime device, one of "cpu", "cuda" or "coreml"
+        quantize: If True, create an int8 copy of the voice model if there isn't one
+        fp32: If True, always use the original fp32 model even if an int8 one exists
+        voice_loader: Called like load_voice to get the voice, e.g. to reuse a preloaded one
 
     Returns:
         True if all segments generated successfully
@@ -163,40 +907,74 @@ def generate_from_text(
 
     # Download voice model if needed
     model_path = ensure_voice_downloaded(voice, models_dir, console)
+    if not fp32:
+        model_path = quantized_model(model_path, create=quantize, console=console)
 
     if console:
         console.print(f"\n[bold]Generating {len(lines)} segments...[/bold]\n")
 
+    params = {
+        "length_scale": length_scale if length_scale is not None else 1.0,
+        "noise_scale": noise_scale if noise_scale is not None else 0.667,
+        "noise_w": noise_w if noise_w is not None else 0.8,
+        "sentence_silence": sentence_silence if sentence_silence is not None else 0.5,
+    }
+
     # Generate each segment
-    success_count = 0
-    generated_files: list[Path] = []
+    output_dir_str = str(output_dir)
+    tasks = [
+        (i, text, os.path.join(output_dir_str, f"segment_{i:03d}.wav"))
+        for i, text in enumerate(lines, 1)
+    ]
+    results: list[str | None] = [None] * len(tasks)
+    unique, repeats = _dedupe(tasks)
+    batches = _batched(unique, batch_size)
+    jobs = resolve_jobs(jobs, len(batches), device)
+    writer = None if use_cli else WavWriter()
+    synth = _make_synth(
+        model_path, jobs, use_cli, batch_size, writer, device, console, voice_loader or load_voice
+    )
 
-    for i, text in enumerate(lines, 1):
-        segment_id = f"segment_{i:03d}"
-        output_file = output_dir / f"{segment_id}.wav"
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(_synth, batch, synth, params) for batch in batches]
+        completed = (result for future in as_completed(futures) for result in future.result())
+        for i, output_file, success in completed:
+            text = tasks[i - 1][1]
 
-        display_text = text[:40] + "..." if len(text) > 40 else text
-        if console:
-            console.print(f"  [{i}/{len(lines)}] {display_text}")
-
-        success = generate_segment(
-            text=text,
-            output_path=output_file,
-            model_path=model_path,
-            length_scale=length_scale if length_scale is not None else 1.0,
-            noise_scale=noise_scale if noise_scale is not None else 0.667,
-            noise_w=noise_w if noise_w is not None else 0.8,
-            sentence_silence=sentence_silence if sentence_silence is not None else 0.5,
-        )
+            display_text = text[:40] + "..." if len(text) > 40 else text
+            if success:
+                results[i - 1] = output_file
+                if console:
+                    console.print(
+                        f"  [{i}/{len(lines)}] [green]✓[/green] "
+                        f"{os.path.basename(output_file)}  {display_text}"
+                    )
+            else:
+                if console:
+                    console.print(f"  [{i}/{len(lines)}] [red]✗ FAILED[/red]  {display_text}")
+
+    if writer is not None:
+        writer.close()
+        results = [None if f in writer.failed else f for f in results]
 
-        if success:
+    # Repeated lines reuse the audio of their first occurrence
+    for i, source_i, output_file in repeats:
+        source = results[source_i - 1]
+        text = tasks[i - 1][1]
+        display_text = text[:40] + "..." if len(text) > 40 else text
+        if source is not None and _link_or_copy(source, output_file):
+            results[i - 1] = output_file
             if console:
-                console.print(f"       [green]✓[/green] {output_file.name}")
-            success_count += 1
-            generated_files.append(output_file)
+                console.print(
+                    f"  [{i}/{len(lines)}] [green]↺[/green] {os.path.basename(output_file)} "
+                    f"(same as {os.path.basename(source)})  {display_text}"
+                )
         else:
             if console:
-                console.print("       [red]✗ FAILED[/red]")
+                console.print(f"  [{i}/{len(lines)}] [red]✗ FAILED[/red]  {display_text}")
+
+    generated_files = [f for f in results if f is not None]
+    success_count = len(generated_files)
 
     if console:
         console.print(f"\n[bold]Completed:[/bold] {success_count}/{len(lines)} segments")
@@ -224,6 +1002,12 @@ def generate_voiceover(
     combine: bool = False,
     combined_filename: str = "combined_voiceover.wav",
     console: Console | None = None,
+    use_cli: bool = False,
+    jobs: int | None = None,
+    batch_size: int = 1,
+    device: str = "cpu",
+    quantize: bool = False,
+    fp32: bool = False,
 ) -> bool:
     """
     Generate voice-over audio from a config file.
@@ -235,6 +1019,12 @@ def generate_voiceover(
         combine: If True, also create a single combined audio file
         combined_filename: Name for the combined output file
         console: Rich console for styled output
+        use_cli: If True, run the piper CLI per segment instead of in-process
+        jobs: Number of segments to synthesize in parallel (default: CPU count)
+        batch_size: Segments to synthesize per ONNX run (default: 1, no batching)
+        device: ONNX Runtime device, one of "cpu", "cuda" or "coreml"
+        quantize: If True, create an int8 copy of the voice model if there isn't one
+        fp32: If True, always use the original fp32 model even if an int8 one exists
 
     Returns:
         True if all segments generated successfully
@@ -262,11 +1052,27 @@ def generate_voiceover(
     voice = config.get("voice", {})
     model_name = voice.get("model", "en_US-hfc_male-medium")
     output_format = config.get("output", {}).get("format", "wav")
+    segments = config.get("segments", [])
+
+    # Segments writing the same file (e.g. ids 1 and "1") would overwrite each other's audio
+    segment_ids = [seg.get("id", f"segment_{i:03d}") for i, seg in enumerate(segments, 1)]
+    output_dir_str = str(output_dir)
+    output_files = [
+        os.path.join(output_dir_str, f"{segment_id}.{output_format}") for segment_id in segment_ids
+    ]
+    if len(set(output_files)) != len(output_files):
+        duplicates = [path for path, count in Counter(output_files).items() if count > 1]
+        msg = f"Duplicate segment output files: {', '.join(map(os.path.basename, duplicates))}"
+        if console:
+            console.print(f"[red]{msg}[/red]")
+        else:
+            print(msg)
+        return False
 
     # Download voice model if needed
     model_path = ensure_voice_downloaded(model_name, models_dir, console)
-
-    segments = config.get("segments", [])
+    if not fp32:
+        model_path = quantized_model(model_path, create=quantize, console=console)
 
     if console:
         console.print(f"[dim]Output: {output_dir}[/dim]")
@@ -277,46 +1083,81 @@ def generate_voiceover(
         print(f"Total segments: {len(segments)}")
         print("-" * 50)
 
+    params = {
+        "length_scale": voice.get("length_scale", 1.0),
+        "noise_scale": voice.get("noise_scale", 0.667),
+        "noise_w": voice.get("noise_w", 0.8),
+        "sentence_silence": voice.get("sentence_silence", 0.5),
+    }
+
     # Generate each segment
-    success_count = 0
-    generated_files: list[Path] = []
+    tasks = [
+        (i, segment.get("text", ""), output_file)
+        for i, (segment, output_file) in enumerate(zip(segments, output_files), 1)
+    ]
+    results: list[str | None] = [None] * len(tasks)
+    unique, repeats = _dedupe(tasks)
+    batches = _batched(unique, batch_size)
+    jobs = resolve_jobs(jobs, len(batches), device)
+    writer = None if use_cli else WavWriter()
+    synth = _make_synth(model_path, jobs, use_cli, batch_size, writer, device, console)
 
-    for i, segment in enumerate(segments, 1):
-        segment_id = segment.get("id", f"segment_{i:03d}")
-        text = segment.get("text", "")
-        output_file = output_dir / f"{segment_id}.{output_format}"
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(_synth, batch, synth, params) for batch in batches]
+        completed = (result for future in as_completed(futures) for result in future.result())
+        for i, output_file, success in completed:
+            segment_id = segment_ids[i - 1]
+            text = tasks[i - 1][1]
 
-        display_text = text[:40] + "..." if len(text) > 40 else text
+            display_text = text[:40] + "..." if len(text) > 40 else text
+            progress = f"  [{i}/{len(segments)}]"
 
-        if console:
-            console.print(f"  [{i}/{len(segments)}] [cyan]{segment_id}[/cyan]")
-            console.print(f"       {display_text}")
-        else:
-            print(f"Generating: {segment_id}")
-            print(f"  Text: {display_text}")
-
-        success = generate_segment(
-            text=text,
-            output_path=output_file,
-            model_path=model_path,
-            length_scale=voice.get("length_scale", 1.0),
-            noise_scale=voice.get("noise_scale", 0.667),
-            noise_w=voice.get("noise_w", 0.8),
-            sentence_silence=voice.get("sentence_silence", 0.5),
-        )
+            if not console:
+                print(f"Generating: {segment_id}")
+                print(f"  Text: {display_text}")
+
+            if success:
+                results[i - 1] = output_file
+                if console:
+                    console.print(
+                        f"{progress} [green]✓[/green] [cyan]{segment_id}[/cyan]  {display_text}"
+                    )
+                else:
+                    print(f"  Saved: {output_file}")
+            else:
+                if console:
+                    console.print(
+                        f"{progress} [red]✗ FAILED[/red] [cyan]{segment_id}[/cyan]  {display_text}"
+                    )
+                else:
+                    print("  FAILED!")
+
+    if writer is not None:
+        writer.close()
+        results = [None if f in writer.failed else f for f in results]
 
-        if success:
+    # Repeated texts reuse the audio of their first occurrence
+    for i, source_i, output_file in repeats:
+        segment_id = segment_ids[i - 1]
+        source = results[source_i - 1]
+        progress = f"  [{i}/{len(segments)}]"
+        if source is not None and _link_or_copy(source, output_file):
+            results[i - 1] = output_file
             if console:
-                console.print(f"       [green]✓[/green] {output_file.name}")
+                console.print(
+                    f"{progress} [green]↺[/green] [cyan]{segment_id}[/cyan]  "
+                    f"same as {os.path.basename(source)}"
+                )
             else:
-                print(f"  Saved: {output_file}")
-            success_count += 1
-            generated_files.append(output_file)
+                print(f"Reused: {segment_id} (same text as {os.path.basename(source)})")
         else:
             if console:
-                console.print("       [red]✗ FAILED[/red]")
+                console.print(f"{progress} [red]✗ FAILED[/red] [cyan]{segment_id}[/cyan]")
             else:
-                print("  FAILED!")
+                print(f"Reused: {segment_id} FAILED!")
+
+    generated_files = [f for f in results if f is not None]
+    success_count = len(generated_files)
 
     if console:
         console.print(f"\n[bold]Completed:[/bold] {success_count}/{len(segments)} segments")